@@ -1,11 +1,10 @@
-import json
 import asyncio
 import typing as tp
-import uuid
 from dataclasses import dataclass, field
 
-from httpx import AsyncClient, Response
-from pydantic import BaseModel
+import orjson
+from httpx import AsyncClient, HTTPStatusError, Limits, Response, Timeout
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from .event import Event
 from .partial import Partial
@@ -17,19 +16,39 @@ T = tp.TypeVar("T", bound=Collection)
 
 logger = get_logger(__name__)
 
-class UUIDEncoder(json.JSONEncoder):
+_loads = orjson.loads
+
+_event_adapters: dict[type, TypeAdapter[tp.Any]] = {}
+_response_adapters: dict[type, TypeAdapter[tp.Any]] = {}
+
+
+def _cached_adapter(cache: dict[type, TypeAdapter[tp.Any]], generic: tp.Any, item: type) -> TypeAdapter[tp.Any]:
     """
-    Custom JSON encoder for UUID objects.
-    
-    This encoder converts UUID objects to their string representation when
-    serializing to JSON.
+    Return the TypeAdapter for `generic[item]`, building it only once per model.
     """
-    def default(self, o: tp.Any) -> tp.Any:
-        if isinstance(o, uuid.UUID):
-            return str(o)
-        return super().default(o)
+    adapter = cache.get(item)
+    if adapter is None:
+        adapter = cache[item] = TypeAdapter(generic[item])
+    return adapter
+
 
-@dataclass
+def _encode_action(event: str, data: BaseModel) -> bytes:
+    """
+    Encode a `{"event": ..., "data": ...}` action request as JSON bytes.
+
+    The model is written by its own compiled pydantic-core serializer, so no
+    intermediate dict is built.
+    """
+    return b"".join((
+        b'{"event":',
+        orjson.dumps(event),
+        b',"data":',
+        data.__pydantic_serializer__.to_json(data, exclude_unset=True, exclude_none=True),
+        b"}",
+    ))
+
+
+@dataclass(slots=True)
 class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
     """
     Base class for interacting with the Quipu API.
@@ -39,10 +58,42 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
     supports both synchronous and asynchronous operations.
     """
     base_url: str = field(default="https://quipubase.online")
-   
-  
+    _client: tp.Optional[AsyncClient] = field(default=None, init=False, repr=False, compare=False)
+    _loop: tp.Optional[asyncio.AbstractEventLoop] = field(default=None, init=False, repr=False, compare=False)
+    _model: tp.ClassVar[tp.Type[Collection]]
+    _event_adapter: tp.ClassVar[TypeAdapter[tp.Any]]
+    _response_adapter: tp.ClassVar[TypeAdapter[tp.Any]]
+
     def __load__(self):
-        return AsyncClient(base_url=self.base_url)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        # Pooled connections belong to the loop that opened them, so a new
+        # loop (e.g. a second asyncio.run) gets a fresh client
+        if self._client is None or (loop is not None and loop is not self._loop):
+            self._client = AsyncClient(
+                base_url=self.base_url,
+                limits=Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=Timeout(30.0),
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and release its pooled connections.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args: tp.Any) -> None:
+        await self.aclose()
 
     @classmethod
     def __class_getitem__(cls, item: tp.Type[T]):
@@ -56,10 +107,12 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
             The class itself
         """
         cls._model = item
+        cls._event_adapter = _cached_adapter(_event_adapters, Event, item)
+        cls._response_adapter = _cached_adapter(_response_adapters, QResponse, item)
         return cls
     
     async def fetch(self, endpoint: str, method: tp.Literal["GET", "POST", "PUT", "DELETE"], headers:dict[str,str]={"Content-Type": "application/json", "Accept": "application/json"},
-                   data: tp.Optional[tp.Union[JsonSchema, T, Partial[T], Request[T]]] = None, 
+                   data: tp.Optional[tp.Union[JsonSchema, T, Partial[T], Request[T], bytes]] = None, 
                    params: tp.Optional[dict[str,tp.Any]] = None) -> Response:
         """
         Base request method for API calls.
@@ -67,27 +120,36 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
         Args:
             endpoint: API endpoint path
             method: HTTP method to use
-            json: Request body data
+            data: Request body data, or an already serialized JSON body as bytes
             params: Query parameters
             
         Returns:
             Parsed JSON response as dict
         """
-        if isinstance(data, BaseModel):
-            d = data.model_dump(exclude_none=True)
+        if isinstance(data, bytes) or data is None:
+            content = data
+        elif isinstance(data, BaseModel):
+            # pydantic-core writes the JSON bytes directly, no intermediate dict
+            content = data.__pydantic_serializer__.to_json(data, exclude_none=True)
         elif isinstance(data, Partial):
-            d = data.data
+            content = orjson.dumps(data.data)
         else:
-            d = data
+            content = orjson.dumps(data)
         try:
             response = await self.__load__().request(
                 method=method,
                 url=endpoint,
-                json=json.loads(json.dumps(d, cls=UUIDEncoder)) if d else None,
+                content=content,
                 params=params,
                 headers=headers
             )
-            return response.raise_for_status()
+            if response.is_success:
+                return response
+            raise HTTPStatusError(
+                f"{response.status_code} {response.reason_phrase} for url '{response.url}'",
+                request=response.request,
+                response=response,
+            )
         except Exception as e:
             logger.error("Error in API request: %s", e)
             raise
@@ -103,9 +165,9 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
             Created collection information
         """
         response = await self.fetch("/v1/collections", "POST", data=schema)
-        return CollectionType(**response.json())
+        return tp.cast(CollectionType, _loads(response.content))
 
-    async def list_collections(self):
+    async def list_collections(self) -> list[CollectionMetadataType]:
         """
         List all collections with pagination.
         
@@ -117,7 +179,7 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
             List of collection IDs
         """
         response = await self.fetch("/v1/collections", "GET")
-        return [CollectionMetadataType(d) for d in response.json()]
+        return tp.cast(list[CollectionMetadataType], _loads(response.content))
 
     async def get_collection(self, collection_id: str) -> CollectionType:
         """
@@ -130,7 +192,7 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
             Collection information
         """
         response = await self.fetch(f"/v1/collections/{collection_id}", "GET")
-        return CollectionType(**response.json())
+        return tp.cast(CollectionType, _loads(response.content))
 
     async def delete_collection(self, collection_id: str) -> dict[str, bool]:
         """
@@ -143,7 +205,7 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
             Deletion status
         """
         response = await self.fetch(f"/v1/collections/{collection_id}", "DELETE")
-        return response.json()
+        return _loads(response.content)
 
 
     async def pub(self, col_id: str, request: Request[T]) -> QResponse[T]:
@@ -160,18 +222,74 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
         assert request.data is not None, "Data must be provided for publishing"
         
         # Structure the action request according to the API's expectations
-        action_request:dict[str,tp.Any] = {
-            "event": request.event,  # create, read, update, delete, query, stop
-            "data": request.data.model_dump(exclude_unset=True,exclude_none=True) if isinstance(request.data, BaseModel) else request.data
-        }
-        
-        response = await self.fetch(f"/v1/events/{col_id}", "POST", data=action_request) # type: ignore
-        data = self._model.model_validate(response.json()["data"])
-        return QResponse[T](col_id=col_id, data=data)
+        # (event: create, read, update, delete, query, stop) and encode it in a single pass
+        if isinstance(request.data, BaseModel):
+            body = _encode_action(request.event, request.data)
+        else:
+            data = request.data.data if isinstance(request.data, Partial) else request.data
+            body = orjson.dumps({"event": request.event, "data": data})
+
+        response = await self.fetch(f"/v1/events/{col_id}", "POST", data=body)
+        payload = _loads(response.content)
+        return self._response_adapter.validate_python({"col_id": col_id, "data": payload["data"]})
+
+    async def abatch_pub(self, col_id: str, requests: tp.Sequence[Request[T]],
+                         concurrency: int = 20) -> list[tp.Union[QResponse[T], BaseException]]:
+        """
+        Publish several requests to a collection at once.
+
+        The API has no batch endpoint, so the requests are sent concurrently
+        over the pooled keep-alive connections, at most `concurrency` at a time.
+        A failed publish does not cancel the others: its slot in the result
+        holds the raised exception instead of a response, so callers can tell
+        exactly which writes went through.
+
+        Args:
+            col_id: ID of the collection
+            requests: Requests with data and event
+            concurrency: Maximum number of publishes in flight, at least 1
+
+        Returns:
+            For each request, in order, its published data information or the
+            exception it failed with
+
+        Raises:
+            ValueError: If `concurrency` is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def publish(request: Request[T]) -> QResponse[T]:
+            async with semaphore:
+                return await self.pub(col_id, request)
+
+        return list(await asyncio.gather(*(publish(request) for request in requests), return_exceptions=True))
+
+    def _decode_event(self, line: bytes) -> tp.Optional[Event[T]]:
+        """
+        Decode a single line of the event stream.
+
+        Args:
+            line: Raw bytes of one line, optionally prefixed with `data: `
+
+        Returns:
+            The decoded event, or None for blank or malformed lines
+        """
+        if line.startswith(b"data: "):
+            line = line[6:]
+        if not line.strip():
+            return None
+        # Parse and validate in one pass, without an intermediate dict
+        try:
+            return self._event_adapter.validate_json(line)
+        except ValidationError as e:
+            logger.error("Error decoding event: %s", e)
+            return None
 
     async def sub(self, col_id: str):
         """
-        Subscribe to a collection with infinite retry.
+        Subscribe to a collection with infinite retry and exponential backoff.
         
         Args:
             col_id: ID of the collection
@@ -180,25 +298,29 @@ class QuipuBase(tp.Generic[T], LazyProxy[AsyncClient]):
             Event objects from the stream
         """
         logger.info("Subscribing to events for collection %s", col_id)
-        client = AsyncClient(
-                    base_url=self.base_url,
-                    timeout=None  # No timeout
-                )
+        attempts = 0
         while True:
             try:
-                async with client.stream("GET", f"/v1/events/{col_id}", 
-                                        headers={"Accept":"application/json"}) as response:
+                async with self.__load__().stream("GET", f"/v1/events/{col_id}",
+                                        headers={"Accept":"application/json"},
+                                        timeout=Timeout(None, connect=10.0)) as response:
                     response.raise_for_status()
-                    async for chunk in response.aiter_lines():
-                        if chunk:
-                            try:
-                                yield Event[T](**json.loads(chunk.strip()))
-                            except json.JSONDecodeError as e:
-                                logger.error("Error decoding JSON: %s", e)
-                                continue
+                    # Frame lines on raw bytes so each one goes straight to the validator
+                    buf = bytearray()
+                    async for chunk in response.aiter_bytes(65536):
+                        buf += chunk
+                        while (nl := buf.find(b"\n")) != -1:
+                            event = self._decode_event(bytes(buf[:nl]))
+                            del buf[:nl + 1]
+                            if event is not None:
+                                attempts = 0
+                                yield event
+                    if buf and (event := self._decode_event(bytes(buf))) is not None:
+                        attempts = 0
+                        yield event
             except Exception as e:
                 logger.error("Subscription error: %s", e)
-                await asyncio.sleep(1)
-                continue
-            finally:
-                await client.aclose()
\ No newline at end of file
+            # The stream failed or ended; back off exponentially (capped at
+            # 30 seconds) before reconnecting, resetting once events flow again
+            await asyncio.sleep(min(1 << attempts, 30))
+            attempts = min(attempts + 1, 5)
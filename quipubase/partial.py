@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import copy
-from typing import (Any, Dict, Generic, List, Type, TypeVar, cast, get_args,
-                    get_origin, get_type_hints)
+from functools import lru_cache
+from typing import (Any, Callable, ClassVar, Dict, FrozenSet, Generic, List,
+                    Optional, Tuple, Type, TypeVar, cast, get_args, get_origin,
+                    get_type_hints)
 
 from pydantic import BaseModel
 
@@ -25,39 +26,46 @@ class Partial(Generic[T]):
         
         # Apply to an existing instance
         updated_user = update.value(original_user)
+
+    `value` never mutates its input. Results share unchanged sub-trees with
+    the original by reference, so only the nodes on the update path are
+    copied.
     """
-    
-    def __new__(cls, **kwargs: Any):
+
+    _origin_type: ClassVar[Optional[type]] = None
+
+    def __init_subclass__(cls, **kwargs: Any):
         """
-        Factory method to validate fields before creating the instance.
-        
-        Args:
-            **kwargs: The fields to update and their new values.
-        
-        Returns:
-            A new Partial instance with validated fields.
+        Resolve the type argument T once, when a typed subclass is created.
         """
-        # Get the type argument T from the class
-        origin_type = None
-        
+        super().__init_subclass__(**kwargs)
+        if "_origin_type" in cls.__dict__:
+            return
         # Check if we're dealing with a subclass that has T specified
-        for base in cls.__orig_bases__ if hasattr(cls, "__orig_bases__") else []: # type: ignore
+        for base in cls.__dict__.get("__orig_bases__", ()):
             origin = get_origin(base) # type: ignore
             if origin is Partial:
                 args = get_args(base)
                 if args and args[0] is not Any:
-                    origin_type = args[0]
+                    cls._origin_type = args[0]
                     break
+
+    def __new__(cls, **kwargs: Any):
+        """
+        Factory method to validate fields before creating the instance.
         
-        # Validate fields against the origin type if it's a BaseModel
-        if origin_type and issubclass(origin_type, BaseModel):
-            model_fields = get_type_hints(origin_type)
-            invalid_fields = [field for field in kwargs if field not in model_fields]
-            
-            if invalid_fields:
-                error_msg = f"Invalid fields for {origin_type.__name__}: {', '.join(invalid_fields)}"
-                raise ValueError(error_msg)
+        Args:
+            **kwargs: The fields to update and their new values.
         
+        Returns:
+            A new Partial instance with validated fields.
+        """
+        allowed_fields = _allowed_fields(cls._origin_type)
+        if allowed_fields is not None and not kwargs.keys() <= allowed_fields:
+            invalid_fields = [field for field in kwargs if field not in allowed_fields]
+            error_msg = f"Invalid fields for {cls._origin_type.__name__}: {', '.join(invalid_fields)}" # type: ignore
+            raise ValueError(error_msg)
+
         instance = super().__new__(cls)
         return instance
     
@@ -81,6 +89,10 @@ class Partial(Generic[T]):
         Returns:
             A new instance with the partial updates applied.
         """
+        # Exact dict/list types resolve with a single lookup
+        handler = Partial._DISPATCH.get(type(original))
+        if handler is not None:
+            return handler(self, original)
         if isinstance(original, BaseModel): # type: ignore
             return self._partial_base_model(original)
         elif isinstance(original, dict): # type: ignore
@@ -101,31 +113,38 @@ class Partial(Generic[T]):
         Returns:
             A new BaseModel with the partial updates applied.
         """
-        # Deep copy to avoid modifying the original
-        result = copy.deepcopy(original)        
+        fields, validate_assignment = _model_meta(type(original))
+        # Only the updated fields are replaced; the rest is shared with the original
+        updates: Dict[str, Any] = {}
         for key, value in self.data.items():
-            if hasattr(result, key):
-                original_value = getattr(result, key)
+            if key in fields or hasattr(original, key):
+                original_value = getattr(original, key)
                 # If the value is another Partial and we're updating a complex type
                 if isinstance(value, Partial) and (isinstance(original_value, (dict, list, BaseModel))):
-                    setattr(result, key, value.value(original_value)) # type: ignore
+                    updates[key] = value.value(original_value) # type: ignore
                 # Handle lists
                 elif isinstance(original_value, list) and isinstance(value, list):
-                    setattr(result, key, self._merge_lists(original_value, value)) # type: ignore
+                    updates[key] = self._merge_lists(original_value, value) # type: ignore
                 # Handle dictionaries
                 elif isinstance(original_value, dict) and isinstance(value, dict):
-                    setattr(result, key, self._merge_dicts(original_value, value)) # type: ignore
+                    updates[key] = self._merge_dicts(original_value, value) # type: ignore
                 # Handle nested BaseModel
                 elif isinstance(original_value, BaseModel) and isinstance(value, dict):
                     # Validate and convert dict to Partial of the appropriate type
                     nested_class = original_value.__class__
                     # Create a typed Partial for the nested model
                     nested_partial = create_typed_partial(nested_class)(**value)
-                    setattr(result, key, nested_partial.value(original_value))
+                    updates[key] = nested_partial.value(original_value)
                 # Direct assignment for other types
                 else:
-                    setattr(result, key, value)
-                    
+                    updates[key] = value
+
+        if not validate_assignment:
+            return cast(T, original.model_copy(update=updates)) # type: ignore
+        # Keep assignment validation for models that ask for it
+        result = original.model_copy()
+        for key, value in updates.items():
+            setattr(result, key, value)
         return cast(T, result) # type: ignore
 
     def _partial_dict(self, original: Dict[Any, Any]) -> Dict[str, Any]:
@@ -138,9 +157,9 @@ class Partial(Generic[T]):
         Returns:
             A new dictionary with the partial updates applied.
         """
-        # Deep copy to avoid modifying the original
-        result = copy.deepcopy(original)
-        
+        # Shallow copy; nested values are replaced, never written into
+        result = dict(original)
+
         for key, value in self.data.items():
             if key in result:
                 original_value = result[key]
@@ -177,8 +196,8 @@ class Partial(Generic[T]):
         if 'items' not in self.data:
             return cast(T, original) # type: ignore
             
-        # Deep copy to avoid modifying the original
-        result = copy.deepcopy(original)
+        # Shallow copy; nested values are replaced, never written into
+        result = list(original)
         partial_items = self.data['items']
         
         # Apply partial updates to list items if provided as a dictionary with indices
@@ -208,6 +227,11 @@ class Partial(Generic[T]):
             
         return cast(T, result) # type: ignore
 
+    _DISPATCH: ClassVar[Dict[type, Callable[..., Any]]] = {
+        dict: _partial_dict,
+        list: _partial_list,
+    }
+
     def _merge_dicts(self, original: Dict[Any, Any], partial: Dict[Any, Any]) -> Dict[Any, Any]:
         """
         Merge two dictionaries recursively.
@@ -219,15 +243,15 @@ class Partial(Generic[T]):
         Returns:
             A new dictionary with the partial updates applied.
         """
-        result = copy.deepcopy(original)
-        
-        for key, value in partial.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_dicts(result[key], value) # type: ignore
-            else:
-                result[key] = value
-                
-        return result
+        return {
+            **original,
+            **{
+                key: self._merge_dicts(original[key], value) # type: ignore
+                if key in original and isinstance(original[key], dict) and isinstance(value, dict)
+                else value
+                for key, value in partial.items()
+            },
+        }
 
     def _merge_lists(self, original: List[Any], partial: List[Any]) -> List[Any]:
         """
@@ -272,6 +296,26 @@ class Partial(Generic[T]):
         else:
             return cls(**instance)
 
+@lru_cache(maxsize=None)
+def _allowed_fields(origin_type: Optional[type]) -> Optional[FrozenSet[str]]:
+    """
+    Field names accepted by a Partial of `origin_type`, or None when the
+    type is not a BaseModel and no validation applies.
+    """
+    if origin_type is None or not isinstance(origin_type, type) or not issubclass(origin_type, BaseModel):
+        return None
+    return frozenset(get_type_hints(origin_type))
+
+
+@lru_cache(maxsize=None)
+def _model_meta(model_type: Type[BaseModel]) -> Tuple[FrozenSet[str], bool]:
+    """
+    Field names of a model and whether it validates on assignment.
+    """
+    return frozenset(model_type.model_fields), bool(model_type.model_config.get("validate_assignment", False))
+
+
+@lru_cache(maxsize=None)
 def create_typed_partial(model_type: Type[T]) -> Type[Partial[T]]:
     """
     Factory function to create a Partial class with a specific type.
@@ -284,5 +328,6 @@ def create_typed_partial(model_type: Type[T]) -> Type[Partial[T]]:
     """
     class TypedPartial(Partial[model_type]):
         __orig_bases__ = (Partial[model_type],)
-    
+        _origin_type = model_type
+
     return TypedPartial
\ No newline at end of file
@@ -17,6 +17,9 @@ class LazyProxy(Generic[T], ABC):
     # Note: we have to special case proxies that themselves return proxies
     # to support using a proxy as a catch-all for any random access, e.g. `proxy.foo.bar.baz`
 
+    # No instance __dict__, but keep subclasses weak-referenceable
+    __slots__ = ("__weakref__",)
+
     def __getattr__(self, attr: str) -> object:
         proxied = self.__get_proxied__()
         if isinstance(proxied, LazyProxy):
@@ -1,77 +1,232 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
+import contextvars
+import inspect
 import logging
+import os
+import queue
+import threading
 import time
 import typing as tp
-from dataclasses import asdict, dataclass, field
-from functools import partial, reduce, wraps
+import warnings
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial, wraps
 from hashlib import sha256
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Callable, Coroutine, Type, TypeVar, cast
 
+import orjson
 from typing_extensions import ParamSpec
 
 T = TypeVar("T")
 P = ParamSpec("P")
 
+MAX_RETRY_DELAY = 30
 
-@dataclass
+_MISSING = object()
+
+# Bound once so the decorator wrappers skip module attribute lookups per call
+_iscoroutinefunction = inspect.iscoroutinefunction
+_async_sleep = asyncio.sleep
+_get_running_loop = asyncio.get_running_loop
+_sleep = time.sleep
+_perf_counter_ns = time.perf_counter_ns
+
+_singleton_lock = threading.RLock()
+
+
+
+def _thread_pool_size(default: int = 64) -> int:
+    """
+    Reads the worker count from QUIPU_THREAD_POOL_SIZE, falling back to
+    `default` when it is unset or empty, not an integer or not positive.
+    """
+    value = os.environ.get("QUIPU_THREAD_POOL_SIZE")
+    if not value:
+        return default
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size > 0:
+        return size
+    warnings.warn(
+        f"Invalid QUIPU_THREAD_POOL_SIZE {value!r}, using {default}",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+    return default
+
+
+def _reset_executor() -> None:
+    """
+    Builds the module's thread pool. Called at import and again in forked
+    children, which inherit the pool's bookkeeping but none of its workers.
+    """
+    global _EXECUTOR
+    _EXECUTOR = ThreadPoolExecutor(
+        max_workers=_thread_pool_size(),
+        thread_name_prefix="quipu",
+    )
+
+
+_EXECUTOR: ThreadPoolExecutor
+_reset_executor()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor)
+
+
+@dataclass(slots=True, init=False, eq=False, repr=False)
 class QuipubaseException(BaseException):
     """Base Tool Exception for handling errors on multiple backends"""
 
     detail: str
     status_code: int = field(default=500)
 
+    def __init__(self, detail: str, status_code: int = 500):
+        BaseException.__init__(self, detail, status_code)
+        self.detail = detail
+        self.status_code = status_code
+
     def model_dump(self):
-        return asdict(self)
+        return {"detail": self.detail, "status_code": self.status_code}
 
     def model_dump_json(self):
-        return json.dumps(asdict(self))
+        return orjson.dumps(self.model_dump()).decode()
 
     def dict(self):
-        return asdict(self)
+        return self.model_dump()
 
     def json(self):
-        return json.dumps(asdict(self))
+        return self.model_dump_json()
 
     def __str__(self):
         return self.json()
 
-    def __repr__(self):
-        return self.__str__()
 
+class LazyJSON:
+    """
+    Defers JSON serialization of a log payload until it is formatted.
+
+    Use `logger.debug("%s", LazyJSON(payload))` instead of
+    `logger.debug(json.dumps(payload))`: logging only interpolates `%s` when
+    a handler emits the record, so disabled levels never serialize.
+    """
 
-def encrypt(s: str):
-    return sha256((s).encode()).hexdigest()
+    __slots__ = ("obj",)
 
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self):
+        return orjson.dumps(self.obj).decode()
+
+
+def encrypt(s: str, _sha256: Callable[..., Any] = sha256) -> str:
+    return _sha256(s.encode()).hexdigest()
+
+
+def encrypt_many(strings: tp.Iterable[str]) -> list[str]:
+    """
+    Hashes many strings with SHA-256, in order.
+
+    :param strings: Strings to hash.
+    :return: Hex digests, one per input string.
+    """
+    _sha256 = sha256
+    return [_sha256(s.encode()).hexdigest() for s in strings]
 
-def get_key(*, object: dict[str, Any], key: str) -> None:
-    try:
-        return object[key]
-    except KeyError:
-        return None
 
+def get_key(*, object: dict[str, Any], key: str) -> Any:
+    """
+    Deprecated: use `object.get(key)` instead.
+    """
+    warnings.warn(
+        "get_key is deprecated, use dict.get instead", DeprecationWarning, stacklevel=2
+    )
+    return object.get(key)
 
-def chunker(seq: str, size: int):
+
+def chunker(seq: str | bytes | bytearray | memoryview, size: int):
+    """
+    Splits a sequence into chunks of at most `size` items.
+
+    Bytes-like inputs are sliced through a memoryview, so the chunks are
+    zero-copy views into the original buffer rather than new objects.
+    """
+    if isinstance(seq, (bytes, bytearray, memoryview)):
+        view = memoryview(seq)
+        return (view[pos : pos + size] for pos in range(0, len(view), size))
     return (seq[pos : pos + size] for pos in range(0, len(seq), size))
 
 
+_FORMAT_STRING = orjson.dumps(
+    {
+        "timestamp": "%(asctime)s",
+        "level": "%(levelname)s",
+        "name": "%(name)s",
+        "message": "%(message)s",
+    }
+).decode()
+_STREAM_HANDLER = logging.StreamHandler()
+_STREAM_HANDLER.setFormatter(logging.Formatter(_FORMAT_STRING))
+
+
+class _QueueHandler(QueueHandler):
+    """
+    Enqueues records with their message already merged, leaving the
+    Formatter work (timestamp, JSON template, traceback) to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Interpolate on the calling thread so arguments mutated after the
+        # log call are logged with the value they had at the call
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _start_listener() -> None:
+    """
+    Starts a listener thread on a fresh queue. Called at import and again in
+    forked children, which inherit the queue but not the thread draining it.
+    """
+    global _QUEUE, _LISTENER
+    _QUEUE = queue.SimpleQueue()
+    _HANDLER.queue = _QUEUE
+    _LISTENER = QueueListener(_QUEUE, _STREAM_HANDLER)
+    _LISTENER.start()
+
+
+def _stop_listener() -> None:
+    _LISTENER.stop()
+
+
+# Records are handed off through a queue; a background listener thread does
+# the formatting and the blocking write to stderr
+_QUEUE: queue.SimpleQueue[logging.LogRecord]
+_LISTENER: QueueListener
+_HANDLER = _QueueHandler(queue.SimpleQueue())
+_start_listener()
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_start_listener)
+
+
 def get_logger(
     name: str | None = None,
     level: int = logging.DEBUG,
-    format_string: str = json.dumps(
-        {
-            "timestamp": "%(asctime)s",
-            "level": "%(levelname)s",
-            "name": "%(name)s",
-            "message": "%(message)s",
-        }
-    ),
+    format_string: str = _FORMAT_STRING,
 ) -> logging.Logger:
     """
     Configures and returns a logger with a specified name, level, and format.
 
+    Loggers using the default format share a single queue-backed handler, so
+    emitting a record only enqueues it and the write happens off-thread.
+
     :param name: Name of the logger. If None, the root logger will be configured.
     :param level: Logging level, e.g., logging.INFO, logging.DEBUG.
     :param format_string: Format string for log messages.
@@ -82,41 +237,101 @@ def get_logger(
     logger_ = logging.getLogger(name)
     logger_.setLevel(level)
     if not logger_.handlers:
-        ch = logging.StreamHandler()
-        formatter = logging.Formatter(format_string)
-        ch.setFormatter(formatter)
+        if format_string == _FORMAT_STRING:
+            ch = _HANDLER
+        else:
+            ch = logging.StreamHandler()
+            ch.setFormatter(logging.Formatter(format_string))
         logger_.addHandler(ch)
-    return logging.getLogger(name)
+    return logger_
 
 
 logger = get_logger()
 
 
+def _log_failure(e: BaseException) -> None:
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("%s: %s", e.__class__.__name__, e)
+
+
+def _log_timing(func: Callable[..., Any], start: int) -> None:
+    logger.info("%s took %.6f seconds", func.__name__, (_perf_counter_ns() - start) / 1e9)
+
+
+def _exhausted(retries: int) -> QuipubaseException:
+    return QuipubaseException(
+        status_code=500, detail=f"Exhausted retries after {retries} attempts"
+    )
+
+
+@tp.overload
+def exception_handler(func: Callable[P, T], *, chain: bool = ...) -> Callable[P, T]: ...
+
+
+@tp.overload
 def exception_handler(
-    func: Callable[P, T],
-) -> Callable[P, T]:
+    func: None = ..., *, chain: bool = ...
+) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+
+
+def exception_handler(
+    func: Callable[P, T] | None = None,
+    *,
+    chain: bool = True,
+) -> Callable[P, T] | Callable[[Callable[P, T]], Callable[P, T]]:
     """
     Decorator to handle exceptions in a function.
 
+    Can be applied bare (`@exception_handler`) or with options
+    (`@exception_handler(chain=False)`).
+
     :param func: Function to be decorated.
+    :param chain: Whether to chain the original exception as `__cause__`.
+        When False the error is raised outside the except block, so it keeps
+        no reference to the original exception or its traceback.
     :return: Decorated function.
     """
+    if func is None:
+
+        def decorator(f: Callable[P, T]) -> Callable[P, T]:
+            return exception_handler(f, chain=chain)
+
+        return decorator
+
+    def _wrap(e: Exception) -> QuipubaseException:
+        name = e.__class__.__name__
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("%s: %s", name, e)
+        return QuipubaseException(
+            status_code=500,
+            detail=f"Internal Server Error: {name} => {e}",
+        )
+
+    if _iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if chain:
+                    raise _wrap(e) from e
+                error = _wrap(e)
+            raise error
+
+        return tp.cast(Callable[P, T], async_wrapper)
 
     @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         try:
-            if asyncio.iscoroutinefunction(func):
-                return await func(*args, **kwargs)
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error("%s: %s", e.__class__.__name__, e)
-            raise QuipubaseException(
-                status_code=500,
-                detail=f"Internal Server Error: {e.__class__.__name__} => {e}",
-            ) from e
+            if chain:
+                raise _wrap(e) from e
+            error = _wrap(e)
+        raise error
 
-    wrapper.__name__ = func.__name__
-    return tp.cast(Callable[P, T], wrapper)
+    return wrapper
 
 
 def timing_handler(
@@ -129,18 +344,29 @@ def timing_handler(
     :return: Decorated function.
     """
 
-    @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        start = time.time()
-        if asyncio.iscoroutinefunction(func):
+    if _iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if not logger.isEnabledFor(logging.INFO):
+                return await func(*args, **kwargs)
+            start = _perf_counter_ns()
             result = await func(*args, **kwargs)
+            _log_timing(func, start)
+            return result
+
+        return tp.cast(Callable[P, T], async_wrapper)
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        if not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+        start = _perf_counter_ns()
         result = func(*args, **kwargs)
-        end = time.time()
-        logger.info("%s took %s seconds", func.__name__, end - start)
-        return tp.cast(T, result)  # type: ignore
+        _log_timing(func, start)
+        return result
 
-    wrapper.__name__ = func.__name__
-    return tp.cast(T, wrapper)  # type: ignore
+    return wrapper
 
 
 def retry_handler(
@@ -151,62 +377,193 @@ def retry_handler(
 
     :param func: Function to be decorated.
     :param retries: Number of retries.
-    :param delay: Delay between retries.
+    :param delay: Initial delay between retries, doubled after each failure
+        up to MAX_RETRY_DELAY.
     :return: Decorated function.
     """
 
+    if _iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            d = delay
+            for attempt in range(1, retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except QuipubaseException as e:
+                    _log_failure(e)
+                    # No backoff once the last attempt has failed
+                    if attempt < retries:
+                        await _async_sleep(d)
+                        d = min(d * 2, MAX_RETRY_DELAY)
+                    continue
+            raise _exhausted(retries)
+
+        return tp.cast(Callable[P, T], async_wrapper)
+
     @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        nonlocal delay
-        for _ in range(retries):
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        d = delay
+        for attempt in range(1, retries + 1):
             try:
-                if asyncio.iscoroutinefunction(func):
-                    result = await func(*args, **kwargs)
-                else:
-                    result = func(*args, **kwargs)
-                return tp.cast(T, result)  # type: ignore
+                return func(*args, **kwargs)
             except QuipubaseException as e:
-                logger.error("%s: %s", e.__class__.__name__, e)
-                time.sleep(delay)
-                delay *= 2
+                _log_failure(e)
+                # No backoff once the last attempt has failed
+                if attempt < retries:
+                    _sleep(d)
+                    d = min(d * 2, MAX_RETRY_DELAY)
                 continue
-        raise QuipubaseException(
-            status_code=500, detail=f"Exhausted retries after {retries} attempts"
-        )
+        raise _exhausted(retries)
+
+    return wrapper
+
 
-    wrapper.__name__ = func.__name__
-    return tp.cast(T, wrapper)  # type: ignore
+@tp.overload
+def handle(func: Callable[P, T], retries: int = ..., delay: int = ...) -> Callable[P, T]: ...
 
 
-def handle(func: Callable[P, T], retries: int = 3, delay: int = 1) -> Callable[P, T]:
+@tp.overload
+def handle(
+    func: None = ..., retries: int = ..., delay: int = ...
+) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+
+
+def handle(
+    func: Callable[P, T] | None = None, retries: int = 3, delay: int = 1
+) -> Callable[P, T] | Callable[[Callable[P, T]], Callable[P, T]]:
     """
     Decorator to retry a function with exponential backoff and handle exceptions.
 
+    Can be applied bare (`@handle`) or with options (`@handle(retries=5)`).
+
+    Equivalent to stacking exception_handler, timing_handler and retry_handler,
+    fused into a single wrapper so each call pays for one extra frame only.
+
     :param func: Function to be decorated.
     :param retries: Number of retries.
-    :param delay: Delay between retries.
+    :param delay: Initial delay between retries, doubled after each failure
+        up to MAX_RETRY_DELAY.
     :return: Decorated function.
     """
-    eb = partial(retry_handler, retries=retries, delay=delay)
-    return reduce(lambda f, g: g(f), [exception_handler, timing_handler, eb], func)  # type: ignore
+    if func is None:
+
+        def decorator(f: Callable[P, T]) -> Callable[P, T]:
+            return handle(f, retries=retries, delay=delay)
+
+        return decorator
+
+    if _iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            d = delay
+            timed = logger.isEnabledFor(logging.INFO)
+            for attempt in range(1, retries + 1):
+                start = _perf_counter_ns() if timed else 0
+                try:
+                    result = await func(*args, **kwargs)
+                except (Exception, QuipubaseException) as e:
+                    _log_failure(e)
+                    # No backoff once the last attempt has failed
+                    if attempt < retries:
+                        await _async_sleep(d)
+                        d = min(d * 2, MAX_RETRY_DELAY)
+                    continue
+                if timed:
+                    _log_timing(func, start)
+                return result
+            raise _exhausted(retries)
+
+        return tp.cast(Callable[P, T], async_wrapper)
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        d = delay
+        timed = logger.isEnabledFor(logging.INFO)
+        for attempt in range(1, retries + 1):
+            start = _perf_counter_ns() if timed else 0
+            try:
+                result = func(*args, **kwargs)
+            except (Exception, QuipubaseException) as e:
+                _log_failure(e)
+                # No backoff once the last attempt has failed
+                if attempt < retries:
+                    _sleep(d)
+                    d = min(d * 2, MAX_RETRY_DELAY)
+                continue
+            if timed:
+                _log_timing(func, start)
+            return result
+        raise _exhausted(retries)
+
+    return wrapper
 
 
-def asyncify(func: Callable[P, T]) -> Callable[P, Coroutine[None, T, T]]:
+@tp.overload
+def asyncify(
+    func: Callable[P, T], executor: Executor | None = ...
+) -> Callable[P, Coroutine[None, T, T]]: ...
+
+
+@tp.overload
+def asyncify(
+    func: None = ..., executor: Executor | None = ...
+) -> Callable[[Callable[P, T]], Callable[P, Coroutine[None, T, T]]]: ...
+
+
+def asyncify(
+    func: Callable[P, T] | None = None, executor: Executor | None = None
+) -> (
+    Callable[P, Coroutine[None, T, T]]
+    | Callable[[Callable[P, T]], Callable[P, Coroutine[None, T, T]]]
+):
     """
     Decorator to convert a synchronous function to an asynchronous function.
 
+    Can be applied bare (`@asyncify`) or with options
+    (`@asyncify(executor=pool)`). Calls run on `executor`, or on the module's
+    own thread pool (sized by QUIPU_THREAD_POOL_SIZE, default 64) instead of
+    the loop's default one.
+
     :param func: Synchronous function to be decorated.
+    :param executor: Executor to run the function on.
     :return: Asynchronous function.
     """
+    if func is None:
+
+        def decorator(f: Callable[P, T]) -> Callable[P, Coroutine[None, T, T]]:
+            return asyncify(f, executor)
+
+        return decorator
 
     @wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        wrapper.__name__ = func.__name__
-        return await asyncio.to_thread(func, *args, **kwargs)
+        ctx = contextvars.copy_context()
+        # The module pool is looked up per call, as a fork replaces it
+        return await _get_running_loop().run_in_executor(
+            executor or _EXECUTOR, partial(ctx.run, func, *args, **kwargs)
+        )
 
     return wrapper
 
 
+def install_uvloop() -> bool:
+    """
+    Installs uvloop as the asyncio event loop policy if it is available.
+
+    Call it before starting the event loop, e.g. before `asyncio.run`.
+
+    :return: True if uvloop was installed, False if it is not available.
+    """
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def singleton(cls: Type[T]) -> Type[T]:
     """
     Decorator that converts a class into a singleton.
@@ -217,13 +574,17 @@ def singleton(cls: Type[T]) -> Type[T]:
     Returns:
                                                                                                                                                                                                                                                                     Type[T]: The singleton instance of the class.
     """
-    instances: dict[Type[T], T] = {}
+    instance: T | None = None
 
     @wraps(cls)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        nonlocal instance
+        if instance is None:
+            # Double-checked so only one thread ever constructs the instance
+            with _singleton_lock:
+                if instance is None:
+                    instance = cls(*args, **kwargs)
+        return instance
 
     return cast(Type[T], wrapper)
 
@@ -235,14 +596,17 @@ def coalesce(*args: T) -> T | None:
     :param args: Arguments to be coalesced.
     :return: First non-None argument.
     """
-    for arg in args:
-        if arg is not None:
-            return arg
-    raise ValueError("No arguments provided")
+    result = next((arg for arg in args if arg is not None), _MISSING)
+    if result is _MISSING:
+        raise ValueError("No arguments provided")
+    return tp.cast(T, result)
 
 
 def merge_dicts(*dicts: dict[str, T]) -> dict[str, T]:
     """
     Merges multiple dictionaries into one.
     """
-    return {k: v for d in dicts for k, v in d.items()}
+    merged: dict[str, T] = {}
+    for d in dicts:
+        merged.update(d)
+    return merged